@@ -15,13 +15,21 @@ GET  /health
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import gzip
+import logging
+
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.data import get_all_content, get_all_users
-from app.recommender import get_recommendations
+from app import embeddings, llm_ranker
+from app.data import get_all_content, get_all_users, get_content_version
+from app.recommender import get_recommendations, warmup
 from app.schemas import ContentItem, RecommendationResponse, UserProfile
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="EduRecommender API",
     description=(
@@ -37,6 +45,75 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# JSON payloads compress well; tiny bodies are not worth the CPU
+_GZIP_MIN_SIZE = 500
+app.add_middleware(GZipMiddleware, minimum_size=_GZIP_MIN_SIZE)
+
+
+def _encode(body: bytes) -> tuple[bytes, bytes | None]:
+    """Pair a JSON body with its gzip encoding (``None`` if too small)."""
+    if len(body) < _GZIP_MIN_SIZE:
+        return body, None
+    return body, gzip.compress(body, mtime=0)
+
+
+def _json_response(request: Request, encoded: tuple[bytes, bytes | None]) -> Response:
+    """Serve a pre-encoded JSON body, pre-gzipped when the client accepts it.
+
+    The ``Content-Encoding`` header makes ``GZipMiddleware`` pass the body
+    through, so static payloads are compressed once rather than per request.
+    """
+    body, gzipped = encoded
+    if gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(body, media_type="application/json")
+
+
+# Catalogue / profile payloads, serialised and compressed once
+# (catalogue: per version)
+_USERS_JSON = _encode(orjson.dumps([user.model_dump() for user in get_all_users()]))
+_content_json: tuple[int, tuple[bytes, bytes | None]] | None = None
+
+
+def _get_content_json() -> tuple[bytes, bytes | None]:
+    """Return the encoded catalogue, re-serialising only on change."""
+    global _content_json  # noqa: PLW0603
+    version = get_content_version()
+    if _content_json is None or _content_json[0] != version:
+        items = get_all_content()
+        _content_json = (
+            version,
+            _encode(orjson.dumps([i.model_dump() for i in items])),
+        )
+    return _content_json[1]
+
+
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+@app.on_event("startup")
+def _warmup() -> None:
+    """Load the embedding model and cache catalogue embeddings up front.
+
+    Failures (model download, unreachable embedding API) are logged, not
+    raised: the other endpoints stay up and the first ``/recommend`` call
+    fills the cache lazily.
+    """
+    try:
+        warmup()
+    except Exception as exc:
+        logger.warning("Warm-up failed; embedding lazily instead (%s).", exc)
+
+
+@app.on_event("shutdown")
+async def _close_clients() -> None:
+    """Release pooled HTTP connections."""
+    await llm_ranker.aclose()
+    await embeddings.aclose()
 
 
 # ---------------------------------------------------------------------------
@@ -49,18 +126,18 @@ def health() -> dict[str, str]:
 
 
 @app.get("/content", response_model=list[ContentItem])
-def list_content() -> list[ContentItem]:
+def list_content(request: Request) -> Response:
     """Return the full content catalogue."""
-    return get_all_content()
+    return _json_response(request, _get_content_json())
 
 
-@app.get("/users")
-def list_users():
+@app.get("/users", response_model=list[UserProfile])
+def list_users(request: Request) -> Response:
     """Return all mock user profiles."""
-    return get_all_users()
+    return _json_response(request, _USERS_JSON)
 
 
 @app.post("/recommend", response_model=RecommendationResponse)
-def recommend(profile: UserProfile) -> RecommendationResponse:
+async def recommend(profile: UserProfile) -> RecommendationResponse:
     """Accept a user profile and return top-3 recommendations."""
-    return get_recommendations(profile)
+    return await get_recommendations(profile)
@@ -16,13 +16,22 @@ LLM_BASE_URL : str
 EMBEDDING_PROVIDER : ``"local"`` | ``"api"``
     Which embedding backend to use.
 EMBEDDING_MODEL_LOCAL : str
-    HuggingFace model id for ``sentence-transformers``.
+    HuggingFace model id of the local model (run via ONNX Runtime).
+EMBEDDING_QUANTIZED : bool
+    Run the local model as a dynamically int8-quantised ONNX graph.
+EMBEDDING_ONNX_THREADS : int
+    Intra-op threads for the local ONNX session.  Defaults to the cores
+    divided among ``WEB_CONCURRENCY`` workers, so workers don't oversubscribe.
 EMBEDDING_MODEL_API : str
     Model id for an OpenAI-compatible embedding endpoint.
 EMBEDDING_API_BASE_URL : str
     URL of the ``/embeddings`` endpoint (only used when provider is ``api``).
 EMBEDDING_API_KEY : str
     Bearer token for the embedding API.
+EMBEDDING_CACHE_DIR : Path
+    Directory where computed content embeddings are persisted between runs.
+QUANTIZE_EMBS : bool
+    Store the cached content matrix as row-scaled int8 instead of FP32.
 """
 
 from __future__ import annotations
@@ -39,6 +48,11 @@ _ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(_ENV_PATH)
 
 
+def _env_flag(name: str, default: str = "false") -> bool:
+    """Interpret an environment variable as a boolean switch."""
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes"}
+
+
 # ---------------------------------------------------------------------------
 # LLM settings
 # ---------------------------------------------------------------------------
@@ -54,9 +68,18 @@ LLM_BASE_URL: str = os.getenv(
 # ---------------------------------------------------------------------------
 EMBEDDING_PROVIDER: str = os.getenv("EMBEDDING_PROVIDER", "local")
 EMBEDDING_MODEL_LOCAL: str = os.getenv("EMBEDDING_MODEL_LOCAL", "all-MiniLM-L6-v2")
+EMBEDDING_QUANTIZED: bool = _env_flag("EMBEDDING_QUANTIZED")
+EMBEDDING_ONNX_THREADS: int = int(
+    os.getenv("EMBEDDING_ONNX_THREADS")
+    or max(1, (os.cpu_count() or 1) // int(os.getenv("WEB_CONCURRENCY") or 1))
+)
 EMBEDDING_MODEL_API: str = os.getenv("EMBEDDING_MODEL_API", "text-embedding-ada-002")
 EMBEDDING_API_BASE_URL: str = os.getenv(
     "EMBEDDING_API_BASE_URL",
     "https://api.openai.com/v1/embeddings",
 )
 EMBEDDING_API_KEY: str = os.getenv("EMBEDDING_API_KEY", "")
+EMBEDDING_CACHE_DIR: Path = Path(
+    os.getenv("EMBEDDING_CACHE_DIR", "~/.cache/edurecommender")
+).expanduser()
+QUANTIZE_EMBS: bool = _env_flag("QUANTIZE_EMBS")
@@ -2,147 +2,148 @@
 Mock educational content catalogue and user profiles.
 
 In production this module would be replaced by a database adapter.
-The helpers below expose a read-only view over the in-memory data.
+The helpers below expose a read-only view over the in-memory data;
+``replace_content`` is the only sanctioned way to change the catalogue and
+bumps a version counter that downstream caches key on.
 """
 
 from __future__ import annotations
 
-from app.schemas import (
-    ContentFormat,
-    ContentItem,
-    Difficulty,
-    LearningStyle,
-    UserProfile,
-)
+from pydantic import TypeAdapter
+
+from app.schemas import ContentItem, UserProfile
 
 # ---------------------------------------------------------------------------
 # Content catalogue (10 items)
 # ---------------------------------------------------------------------------
-CONTENT_ITEMS: list[ContentItem] = [
-    ContentItem(
-        id=1,
-        title="Introduction to Kubernetes for ML Engineers",
-        description=(
+_RAW_CONTENT: list[dict] = [
+    {
+        "id": 1,
+        "title": "Introduction to Kubernetes for ML Engineers",
+        "description": (
             "Hands-on deployment walkthrough using Docker and Kubernetes. "
             "Covers pod creation, service exposure, and scaling ML "
             "inference endpoints."
         ),
-        difficulty=Difficulty.INTERMEDIATE,
-        duration_minutes=45,
-        tags=["kubernetes", "ml", "deployment", "docker"],
-        format=ContentFormat.VIDEO,
-    ),
-    ContentItem(
-        id=2,
-        title="Python for Data Science \u2013 From Zero to Pandas",
-        description=(
+        "difficulty": "Intermediate",
+        "duration_minutes": 45,
+        "tags": ["kubernetes", "ml", "deployment", "docker"],
+        "format": "video",
+    },
+    {
+        "id": 2,
+        "title": "Python for Data Science \u2013 From Zero to Pandas",
+        "description": (
             "Beginner-friendly course covering Python basics, NumPy arrays, "
             "and Pandas DataFrames for exploratory data analysis."
         ),
-        difficulty=Difficulty.BEGINNER,
-        duration_minutes=60,
-        tags=["python", "data-science", "pandas", "numpy"],
-        format=ContentFormat.LECTURE,
-    ),
-    ContentItem(
-        id=3,
-        title="Deep Learning Fundamentals with PyTorch",
-        description=(
+        "difficulty": "Beginner",
+        "duration_minutes": 60,
+        "tags": ["python", "data-science", "pandas", "numpy"],
+        "format": "lecture",
+    },
+    {
+        "id": 3,
+        "title": "Deep Learning Fundamentals with PyTorch",
+        "description": (
             "Build neural networks from scratch using PyTorch. Covers "
             "tensors, autograd, CNNs, and training loops with real datasets."
         ),
-        difficulty=Difficulty.INTERMEDIATE,
-        duration_minutes=90,
-        tags=["deep-learning", "pytorch", "neural-networks", "ml"],
-        format=ContentFormat.VIDEO,
-    ),
-    ContentItem(
-        id=4,
-        title="MLOps Pipeline Design Patterns",
-        description=(
+        "difficulty": "Intermediate",
+        "duration_minutes": 90,
+        "tags": ["deep-learning", "pytorch", "neural-networks", "ml"],
+        "format": "video",
+    },
+    {
+        "id": 4,
+        "title": "MLOps Pipeline Design Patterns",
+        "description": (
             "Slide deck covering CI/CD for ML models, feature stores, "
             "model registries, and monitoring in production."
         ),
-        difficulty=Difficulty.ADVANCED,
-        duration_minutes=30,
-        tags=["mlops", "ci-cd", "deployment", "monitoring"],
-        format=ContentFormat.SLIDES,
-    ),
-    ContentItem(
-        id=5,
-        title="Natural Language Processing with Transformers",
-        description=(
+        "difficulty": "Advanced",
+        "duration_minutes": 30,
+        "tags": ["mlops", "ci-cd", "deployment", "monitoring"],
+        "format": "slides",
+    },
+    {
+        "id": 5,
+        "title": "Natural Language Processing with Transformers",
+        "description": (
             "Understand attention mechanisms, BERT, and GPT architectures. "
             "Includes fine-tuning a text classifier on custom data."
         ),
-        difficulty=Difficulty.ADVANCED,
-        duration_minutes=75,
-        tags=["nlp", "transformers", "bert", "ml"],
-        format=ContentFormat.LECTURE,
-    ),
-    ContentItem(
-        id=6,
-        title="Data Engineering with Apache Spark",
-        description=(
+        "difficulty": "Advanced",
+        "duration_minutes": 75,
+        "tags": ["nlp", "transformers", "bert", "ml"],
+        "format": "lecture",
+    },
+    {
+        "id": 6,
+        "title": "Data Engineering with Apache Spark",
+        "description": (
             "Process large-scale datasets using PySpark. Covers RDDs, "
             "DataFrames, Spark SQL, and integration with cloud storage."
         ),
-        difficulty=Difficulty.INTERMEDIATE,
-        duration_minutes=50,
-        tags=["data-engineering", "spark", "python", "big-data"],
-        format=ContentFormat.VIDEO,
-    ),
-    ContentItem(
-        id=7,
-        title="Git & GitHub for Collaborative Projects",
-        description=(
+        "difficulty": "Intermediate",
+        "duration_minutes": 50,
+        "tags": ["data-engineering", "spark", "python", "big-data"],
+        "format": "video",
+    },
+    {
+        "id": 7,
+        "title": "Git & GitHub for Collaborative Projects",
+        "description": (
             "Learn branching strategies, pull requests, merge conflicts, "
             "and GitHub Actions for automating workflows."
         ),
-        difficulty=Difficulty.BEGINNER,
-        duration_minutes=25,
-        tags=["git", "github", "collaboration", "ci-cd"],
-        format=ContentFormat.SLIDES,
-    ),
-    ContentItem(
-        id=8,
-        title="Building REST APIs with FastAPI",
-        description=(
+        "difficulty": "Beginner",
+        "duration_minutes": 25,
+        "tags": ["git", "github", "collaboration", "ci-cd"],
+        "format": "slides",
+    },
+    {
+        "id": 8,
+        "title": "Building REST APIs with FastAPI",
+        "description": (
             "Create production-ready REST APIs with FastAPI. Covers path "
             "parameters, Pydantic validation, async handlers, and "
             "OpenAPI docs."
         ),
-        difficulty=Difficulty.INTERMEDIATE,
-        duration_minutes=40,
-        tags=["fastapi", "python", "api", "backend"],
-        format=ContentFormat.VIDEO,
-    ),
-    ContentItem(
-        id=9,
-        title="AI Model Deployment on AWS SageMaker",
-        description=(
+        "difficulty": "Intermediate",
+        "duration_minutes": 40,
+        "tags": ["fastapi", "python", "api", "backend"],
+        "format": "video",
+    },
+    {
+        "id": 9,
+        "title": "AI Model Deployment on AWS SageMaker",
+        "description": (
             "Step-by-step guide to packaging, deploying, and A/B testing "
             "ML models on AWS SageMaker with auto-scaling."
         ),
-        difficulty=Difficulty.ADVANCED,
-        duration_minutes=55,
-        tags=["aws", "sagemaker", "deployment", "ml"],
-        format=ContentFormat.LECTURE,
-    ),
-    ContentItem(
-        id=10,
-        title="Prompt Engineering for Large Language Models",
-        description=(
+        "difficulty": "Advanced",
+        "duration_minutes": 55,
+        "tags": ["aws", "sagemaker", "deployment", "ml"],
+        "format": "lecture",
+    },
+    {
+        "id": 10,
+        "title": "Prompt Engineering for Large Language Models",
+        "description": (
             "Master prompt design techniques: few-shot, chain-of-thought, "
             "and system prompts for ChatGPT, Claude, and open-source LLMs."
         ),
-        difficulty=Difficulty.BEGINNER,
-        duration_minutes=35,
-        tags=["llm", "prompt-engineering", "ai", "nlp"],
-        format=ContentFormat.SLIDES,
-    ),
+        "difficulty": "Beginner",
+        "duration_minutes": 35,
+        "tags": ["llm", "prompt-engineering", "ai", "nlp"],
+        "format": "slides",
+    },
 ]
 
+# One compiled validator/serializer for the whole list
+_ITEMS_ADAPTER = TypeAdapter(list[ContentItem])
+CONTENT_ITEMS: list[ContentItem] = _ITEMS_ADAPTER.validate_python(_RAW_CONTENT)
 
 # ---------------------------------------------------------------------------
 # User profiles (3 personas)
@@ -155,8 +156,8 @@ USER_PROFILES: list[UserProfile] = [
             "Learn to deploy ML models into production using "
             "Kubernetes and cloud platforms"
         ),
-        learning_style=LearningStyle.VISUAL,
-        preferred_difficulty=Difficulty.INTERMEDIATE,
+        learning_style="visual",
+        preferred_difficulty="Intermediate",
         time_per_day=60,
         viewed_content_ids=[1],
         interest_tags=["ml", "deployment", "kubernetes", "docker"],
@@ -168,8 +169,8 @@ USER_PROFILES: list[UserProfile] = [
             "Transition from software engineering to data science "
             "and machine learning"
         ),
-        learning_style=LearningStyle.HANDS_ON,
-        preferred_difficulty=Difficulty.BEGINNER,
+        learning_style="hands-on",
+        preferred_difficulty="Beginner",
         time_per_day=45,
         viewed_content_ids=[7],
         interest_tags=["python", "data-science", "ml", "numpy"],
@@ -181,8 +182,8 @@ USER_PROFILES: list[UserProfile] = [
             "Master advanced NLP and LLM techniques for building "
             "AI-powered applications"
         ),
-        learning_style=LearningStyle.READING,
-        preferred_difficulty=Difficulty.ADVANCED,
+        learning_style="reading",
+        preferred_difficulty="Advanced",
         time_per_day=90,
         viewed_content_ids=[5],
         interest_tags=["nlp", "transformers", "llm", "prompt-engineering"],
@@ -190,6 +191,11 @@ USER_PROFILES: list[UserProfile] = [
 ]
 
 
+# Incremented on every catalogue mutation (O(1) cache key for consumers)
+_content_version = 0
+_content_dicts: tuple[int, list[dict]] | None = None
+
+
 # ---------------------------------------------------------------------------
 # Public accessors
 # ---------------------------------------------------------------------------
@@ -198,6 +204,32 @@ def get_all_content() -> list[ContentItem]:
     return CONTENT_ITEMS
 
 
+def get_all_content_dicts() -> list[dict]:
+    """Return the catalogue as plain dicts (dumped once per content version).
+
+    Callers must treat the result as read-only; it is shared between calls.
+    """
+    global _content_dicts  # noqa: PLW0603
+    if _content_dicts is None or _content_dicts[0] != _content_version:
+        _content_dicts = (
+            _content_version,
+            _ITEMS_ADAPTER.dump_python(CONTENT_ITEMS, mode="json"),
+        )
+    return _content_dicts[1]
+
+
+def get_content_version() -> int:
+    """Return the catalogue version; it changes whenever the content does."""
+    return _content_version
+
+
+def replace_content(items: list[ContentItem]) -> None:
+    """Swap in a new catalogue and bump the content version."""
+    global CONTENT_ITEMS, _content_version  # noqa: PLW0603
+    CONTENT_ITEMS = list(items)
+    _content_version += 1
+
+
 def get_all_users() -> list[UserProfile]:
     """Return all mock user profiles."""
     return USER_PROFILES
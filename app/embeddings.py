@@ -1,95 +1,476 @@
 """
 Embedding generation and cosine-similarity retrieval.
 
+All embeddings are L2-normalised when produced, so cosine similarity
+reduces to a plain dot product at retrieval time.
+
 Supports two providers (controlled by ``EMBEDDING_PROVIDER`` in ``.env``):
 
-* ``"local"``  — sentence-transformers (default: ``all-MiniLM-L6-v2``)
+* ``"local"``  — ONNX Runtime export of a sentence-transformers model
+  (default: ``all-MiniLM-L6-v2``), mean-pooled like sentence-transformers
 * ``"api"``    — any OpenAI-compatible ``/embeddings`` endpoint
 
+Content embeddings are cached per item (keyed by id + SHA1 of the item's
+text) and persisted to ``EMBEDDING_CACHE_DIR`` as a memory-mapped ``.npy``
+matrix, so that neither repeated requests nor process restarts re-embed an
+unchanged catalogue.
+
+On the async path, concurrent API-provider embedding requests are
+coalesced by a micro-batcher into a single ``/embeddings`` call.
+
 Public API
 ----------
+warmup(items)
+    Load the model and populate the content-embedding cache.
+close()
+    Close the pooled embedding-API client.
+aclose()
+    Stop the async micro-batcher and close every pooled client.
 get_content_embeddings(items)
     Embed a list of content items -> ``(N, dim)`` array.
 get_user_embedding(profile)
     Embed a user profile -> ``(1, dim)`` array.
+quantize_embeddings(embs) -> QuantizedEmbeddings
+    Row-wise int8 quantisation of a content matrix (``QUANTIZE_EMBS``).
+get_user_embedding_async(profile)
+    Coroutine variant of ``get_user_embedding``.
+embed_texts_async(texts)
+    Coroutine returning an ``(N, dim)`` array for *texts*.
 retrieve_top_k(user_emb, content_embs, items, k, exclude_ids)
-    Return the *k* most relevant content items by cosine similarity.
+    Return the *k* most relevant content items by cosine similarity;
+    *content_embs* may be an FP32 matrix or ``QuantizedEmbeddings``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
 import numpy as np
-import requests as http_requests
+import orjson
 from numpy.typing import NDArray
-from sklearn.metrics.pairwise import cosine_similarity
 
 from app.config import (
     EMBEDDING_API_BASE_URL,
     EMBEDDING_API_KEY,
+    EMBEDDING_CACHE_DIR,
     EMBEDDING_MODEL_API,
     EMBEDDING_MODEL_LOCAL,
+    EMBEDDING_ONNX_THREADS,
     EMBEDDING_PROVIDER,
+    EMBEDDING_QUANTIZED,
 )
 from app.schemas import ContentItem, UserProfile
 
+try:  # optional SIMD kernels for the similarity step
+    import simsimd
+except ImportError:  # pragma: no cover - NumPy fallback below
+    simsimd = None
+
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Lazy-loaded local model (avoids import cost when using the API provider)
 # ---------------------------------------------------------------------------
+_MAX_SEQ_LENGTH = 256  # sentence-transformers default for MiniLM models
+_QUANTIZED_FILE = "model_int8.onnx"
+# Files a complete export directory must contain (graph + tokenizer)
+_EXPORT_MARKERS = ("model.onnx", "tokenizer_config.json")
 _local_model = None
+# Serialises the first load: request threads and to_thread workers may race
+_local_model_lock = threading.Lock()
+
+
+def _hub_model_id(name: str) -> str:
+    """Expand short sentence-transformers names to their Hub repo id."""
+    return name if "/" in name else f"sentence-transformers/{name}"
+
+
+def _export_complete(onnx_dir: Path) -> bool:
+    """Return whether *onnx_dir* holds both the ONNX graph and tokenizer."""
+    return all((onnx_dir / name).exists() for name in _EXPORT_MARKERS)
+
+
+def _export_onnx(model_id: str, onnx_dir: Path) -> None:
+    """Export *model_id* to ONNX and move it into *onnx_dir* atomically.
+
+    The export is written to a private temporary directory and renamed
+    into place, so a crash never leaves a half-written directory behind and
+    concurrent workers each publish a complete copy (the first one wins).
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    onnx_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp = onnx_dir.with_name(f"{onnx_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        ORTModelForFeatureExtraction.from_pretrained(
+            model_id, export=True
+        ).save_pretrained(tmp)
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(tmp)
+        if onnx_dir.exists() and not _export_complete(onnx_dir):
+            shutil.rmtree(onnx_dir, ignore_errors=True)  # pre-atomic leftover
+        try:
+            os.replace(tmp, onnx_dir)
+        except OSError:
+            if not _export_complete(onnx_dir):
+                raise  # nobody else published a usable export either
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _load_local_model():
+    """Export (once), optionally quantise, and load the ONNX model.
+
+    The model is exported from the Hub checkpoint once and saved under
+    ``EMBEDDING_CACHE_DIR/onnx`` so later processes load the ONNX graph
+    directly.  With ``EMBEDDING_QUANTIZED`` set, a dynamically int8-quantised
+    copy of the graph is produced alongside it and loaded instead.
+    """
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    model_id = _hub_model_id(EMBEDDING_MODEL_LOCAL)
+    onnx_dir = EMBEDDING_CACHE_DIR / "onnx" / model_id.replace("/", "--")
+    if not _export_complete(onnx_dir):
+        _export_onnx(model_id, onnx_dir)
+
+    file_name = "model.onnx"
+    if EMBEDDING_QUANTIZED:
+        file_name = _QUANTIZED_FILE
+        if not (onnx_dir / file_name).exists():
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            # Quantise to a private file, then publish it atomically
+            tmp = onnx_dir / f"{file_name}.{os.getpid()}.tmp"
+            try:
+                quantize_dynamic(
+                    str(onnx_dir / "model.onnx"),
+                    str(tmp),
+                    op_types_to_quantize=["MatMul", "Gemm"],
+                    weight_type=QuantType.QInt8,
+                )
+                os.replace(tmp, onnx_dir / file_name)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = (
+        ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    sess_options.intra_op_num_threads = EMBEDDING_ONNX_THREADS
+
+    model = ORTModelForFeatureExtraction.from_pretrained(
+        onnx_dir,
+        file_name=file_name,
+        provider="CPUExecutionProvider",
+        session_options=sess_options,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+    return model, tokenizer
 
 
 def _get_local_model():
-    """Load the sentence-transformers model on first call."""
+    """Return the ``(model, tokenizer)`` pair, loading it on first call.
+
+    Thread-safe: concurrent first callers (request threads, ``to_thread``
+    workers) wait for a single load instead of exporting twice.
+    """
     global _local_model  # noqa: PLW0603
     if _local_model is None:
-        from sentence_transformers import SentenceTransformer
-
-        _local_model = SentenceTransformer(EMBEDDING_MODEL_LOCAL)
+        with _local_model_lock:
+            if _local_model is None:
+                _local_model = _load_local_model()
     return _local_model
 
 
+# ---------------------------------------------------------------------------
+# Pooled HTTP client for the API provider (keeps connections alive)
+# ---------------------------------------------------------------------------
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Create the shared embedding-API client on first call."""
+    global _http_client  # noqa: PLW0603
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+    return _http_client
+
+
+def close() -> None:
+    """Close the shared embedding-API client, if one was created."""
+    global _http_client  # noqa: PLW0603
+    if _http_client is not None:
+        _http_client.close()
+    _http_client = None
+
+
+async def aclose() -> None:
+    """Stop the micro-batcher and close all pooled clients."""
+    global _batcher  # noqa: PLW0603
+    if _batcher is not None:
+        await _batcher.aclose()
+    _batcher = None
+    close()
+
+
 # ---------------------------------------------------------------------------
 # Provider-agnostic embedding function
 # ---------------------------------------------------------------------------
+def _normalise_rows(vecs: NDArray[np.float32]) -> NDArray[np.float32]:
+    """L2-normalise each row of *vecs* in place.
+
+    Squared norms come from a single ``einsum`` row-wise dot, so each row
+    costs one ``sqrt`` and no ``np.linalg.norm`` dispatch.
+    """
+    vecs /= np.sqrt(np.einsum("ij,ij->i", vecs, vecs))[:, None]
+    return vecs
+
+
 def _embed_texts(texts: list[str]) -> NDArray[np.float32]:
-    """Return an ``(N, dim)`` array of embeddings for *texts*."""
+    """Return an ``(N, dim)`` array of unit-length embeddings for *texts*."""
     if EMBEDDING_PROVIDER == "api":
         return _embed_via_api(texts)
     return _embed_locally(texts)
 
 
 def _embed_locally(texts: list[str]) -> NDArray[np.float32]:
-    """Encode *texts* using the local sentence-transformers model."""
-    model = _get_local_model()
-    return model.encode(texts, convert_to_numpy=True)
+    """Encode *texts* with the local ONNX model (mean pooling + L2 norm)."""
+    model, tokenizer = _get_local_model()
+    batches: list[NDArray[np.float32]] = []
+    for start in range(0, len(texts), 32):
+        enc = tokenizer(
+            texts[start : start + 32],
+            padding=True,
+            truncation=True,
+            max_length=_MAX_SEQ_LENGTH,
+            return_tensors="np",
+        )
+        hidden = model(**enc).last_hidden_state
+        mask = enc["attention_mask"][..., None].astype(np.float32)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(
+            mask.sum(axis=1), 1e-9, None
+        )
+        batches.append(pooled.astype(np.float32))
+    return _normalise_rows(np.vstack(batches))
 
 
-def _embed_via_api(texts: list[str]) -> NDArray[np.float32]:
-    """Call an OpenAI-compatible ``/embeddings`` endpoint."""
-    headers = {
-        "Authorization": f"Bearer {EMBEDDING_API_KEY}",
-        "Content-Type": "application/json",
+# Cold catalogues at least this large are embedded in parallel chunks
+_PARALLEL_EMBED_MIN = 256
+
+
+def _embed_texts_parallel(texts: list[str]) -> NDArray[np.float32]:
+    """Embed a large batch, overlapping API round-trips on a thread pool.
+
+    Only the API provider is chunked: its requests are I/O bound, whereas the
+    local ONNX session already spreads one batch over its intra-op threads and
+    concurrent ``run()`` calls would just oversubscribe the cores.  Below
+    ``_PARALLEL_EMBED_MIN`` texts the pool overhead is not worth paying.
+    """
+    workers = os.cpu_count() or 1
+    if (
+        EMBEDDING_PROVIDER != "api"
+        or len(texts) < _PARALLEL_EMBED_MIN
+        or workers == 1
+    ):
+        return _embed_texts(texts)
+    # Create the shared client before the workers race to do so
+    _get_http_client()
+    size = -(-len(texts) // workers)
+    chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        return np.vstack(list(pool.map(_embed_texts, chunks)))
+
+
+def _api_request(texts: list[str]) -> dict:
+    """Build the keyword arguments for an ``/embeddings`` POST."""
+    return {
+        "url": EMBEDDING_API_BASE_URL,
+        "content": orjson.dumps({"model": EMBEDDING_MODEL_API, "input": texts}),
+        "headers": {
+            "Authorization": f"Bearer {EMBEDDING_API_KEY}",
+            "Content-Type": "application/json",
+        },
     }
-    payload = {"model": EMBEDDING_MODEL_API, "input": texts}
-    resp = http_requests.post(
-        EMBEDDING_API_BASE_URL,
-        json=payload,
-        headers=headers,
-        timeout=30,
-    )
+
+
+def _parse_api_response(resp: httpx.Response) -> NDArray[np.float32]:
+    """Turn an ``/embeddings`` response into unit-length vectors."""
     resp.raise_for_status()
-    data = sorted(resp.json()["data"], key=lambda d: d["index"])
-    return np.array([d["embedding"] for d in data], dtype=np.float32)
+    data = sorted(orjson.loads(resp.content)["data"], key=lambda d: d["index"])
+    vecs = np.array([d["embedding"] for d in data], dtype=np.float32)
+    return _normalise_rows(vecs)
+
+
+def _embed_via_api(texts: list[str]) -> NDArray[np.float32]:
+    """Call an OpenAI-compatible ``/embeddings`` endpoint."""
+    resp = _get_http_client().post(**_api_request(texts))
+    return _parse_api_response(resp)
+
+
+# ---------------------------------------------------------------------------
+# Async micro-batching for the API provider
+# ---------------------------------------------------------------------------
+class _EmbeddingBatcher:
+    """Coalesce concurrent embedding requests into single API calls.
+
+    Texts queued within ``window`` seconds of each other (up to
+    ``max_batch``) are sent as one ``input`` list; each caller's future is
+    resolved with its own row of the response.  Every batch is posted from
+    its own task, so a slow request never holds up the batches behind it.
+    """
+
+    def __init__(self, window: float = 0.005, max_batch: int = 16) -> None:
+        self.loop = asyncio.get_running_loop()
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        self._flushes: set[asyncio.Task] = set()
+        self._task = self.loop.create_task(self._run())
+
+    async def embed(self, texts: list[str]) -> NDArray[np.float32]:
+        """Queue *texts* and wait for their embeddings."""
+        futures = [self.loop.create_future() for _ in texts]
+        for text, fut in zip(texts, futures):
+            self._queue.put_nowait((text, fut))
+        return np.vstack(await asyncio.gather(*futures))
+
+    async def aclose(self) -> None:
+        """Stop the batcher, failing queued and in-flight callers.
+
+        Nobody is left waiting on a future once this returns; the HTTP
+        client is closed last.
+        """
+        self._task.cancel()
+        for task in self._flushes:
+            task.cancel()
+        await asyncio.gather(self._task, *self._flushes, return_exceptions=True)
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        _fail(pending, RuntimeError("Embedding batcher closed."))
+        await self._client.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self.loop.time() + self._window
+            try:
+                while len(batch) < self._max_batch:
+                    remaining = deadline - self.loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), remaining)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                _fail(batch, RuntimeError("Embedding batcher closed."))
+                raise
+            task = self.loop.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            resp = await self._client.post(
+                **_api_request([text for text, _ in batch])
+            )
+            vecs = _parse_api_response(resp)
+        except asyncio.CancelledError:
+            _fail(batch, RuntimeError("Embedding batcher closed."))
+            raise
+        except Exception as exc:
+            _fail(batch, exc)
+            return
+        for (_, fut), vec in zip(batch, vecs):
+            if not fut.done():
+                fut.set_result(vec)
+
+
+def _fail(batch: list[tuple[str, asyncio.Future]], exc: BaseException) -> None:
+    """Resolve every still-pending future in *batch* with *exc*."""
+    for _, fut in batch:
+        if not fut.done():
+            fut.set_exception(exc)
+
+
+_batcher: _EmbeddingBatcher | None = None
+
+
+def _get_batcher() -> _EmbeddingBatcher:
+    """Return the batcher bound to the running loop, creating it if needed.
+
+    A batcher left on another loop is shut down there (task cancelled,
+    client closed) when that loop is still running.
+    """
+    global _batcher  # noqa: PLW0603
+    if _batcher is None or _batcher.loop is not asyncio.get_running_loop():
+        if _batcher is not None and _batcher.loop.is_running():
+            asyncio.run_coroutine_threadsafe(_batcher.aclose(), _batcher.loop)
+        _batcher = _EmbeddingBatcher()
+    return _batcher
 
 
 # ---------------------------------------------------------------------------
 # Text representation helpers
 # ---------------------------------------------------------------------------
+_CONTENT_TEXT_CACHE: dict[int, tuple[ContentItem, str]] = {}
+
+
 def _content_text(item: ContentItem) -> str:
     """Build a single search-friendly string from a content item."""
     return f"{item.title}. {item.description} Tags: {', '.join(item.tags)}"
 
 
+def _content_texts(items: list[ContentItem]) -> list[str]:
+    """Return ``_content_text`` for each item, memoised per item object.
+
+    Entries keep their item so a recycled ``id()`` can never return another
+    item's text.  When the catalogue is replaced, entries for items no longer
+    in it are dropped so the old ``ContentItem`` objects can be freed.
+    """
+    texts = []
+    changed = False
+    for item in items:
+        cached = _CONTENT_TEXT_CACHE.get(id(item))
+        if cached is None or cached[0] is not item:
+            cached = _CONTENT_TEXT_CACHE[id(item)] = (item, _content_text(item))
+            changed = True
+        texts.append(cached[1])
+    if changed and len(_CONTENT_TEXT_CACHE) > len(items):
+        live = {id(item) for item in items}
+        for stale in [key for key in _CONTENT_TEXT_CACHE if key not in live]:
+            del _CONTENT_TEXT_CACHE[stale]
+    return texts
+
+
 def _user_text(profile: UserProfile) -> str:
     """Build a single search-friendly string from a user profile."""
     return (
@@ -99,35 +480,285 @@ def _user_text(profile: UserProfile) -> str:
     )
 
 
+# ---------------------------------------------------------------------------
+# Content-embedding cache (in memory + .npy matrix on disk)
+# ---------------------------------------------------------------------------
+# The vectors live in one .npy matrix that is memory-mapped on load (so
+# processes share it through the page cache); a JSON sidecar maps each
+# row to its (item id, text digest) key plus the model, format and a digest
+# of the matrix bytes, so a sidecar is never paired with another matrix.
+_CACHE_PATH = EMBEDDING_CACHE_DIR / "content_embs.npy"
+_CACHE_META_PATH = EMBEDDING_CACHE_DIR / "content_embs.json"
+_CACHE_FORMAT = 4  # bump when the stored vectors change meaning
+_CONTENT_EMB_CACHE: dict[tuple[int, str], NDArray[np.float32]] = {}
+_disk_cache_loaded = False
+
+
+def _model_id() -> str:
+    """Identify the active embedding model (cache entries are per model)."""
+    if EMBEDDING_PROVIDER == "api":
+        return f"api:{EMBEDDING_MODEL_API}"
+    suffix = ":int8" if EMBEDDING_QUANTIZED else ""
+    return f"onnx:{_hub_model_id(EMBEDDING_MODEL_LOCAL)}{suffix}"
+
+
+def _cache_key(item: ContentItem, text: str) -> tuple[int, str]:
+    """Key a content embedding by item id and a digest of its text."""
+    return item.id, hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _matrix_digest(matrix: NDArray[np.float32]) -> str:
+    """Fingerprint the shape and bytes of a cached embedding matrix."""
+    digest = hashlib.sha1(repr(matrix.shape).encode())
+    digest.update(np.ascontiguousarray(matrix).data)
+    return digest.hexdigest()
+
+
+def _load_disk_cache() -> None:
+    """Populate the in-memory cache from disk once per process.
+
+    Cached rows are read-only views into the memory-mapped matrix; the
+    matrix is only used when its digest matches the one in the sidecar.
+    """
+    global _disk_cache_loaded  # noqa: PLW0603
+    if _disk_cache_loaded:
+        return
+    _disk_cache_loaded = True
+    try:
+        meta = orjson.loads(_CACHE_META_PATH.read_bytes())
+        matrix = np.load(_CACHE_PATH, mmap_mode="r")
+    except FileNotFoundError:
+        return
+    except Exception as exc:
+        logger.warning("Ignoring unreadable embedding cache (%s).", exc)
+        return
+    keys = meta.get("keys", [])
+    if (
+        meta.get("format") == _CACHE_FORMAT
+        and meta.get("model") == _model_id()
+        and matrix.dtype == np.float32
+        and matrix.ndim == 2
+        and len(keys) == len(matrix)
+        and meta.get("digest") == _matrix_digest(matrix)
+    ):
+        _CONTENT_EMB_CACHE.update(
+            ((item_id, digest), matrix[row])
+            for row, (item_id, digest) in enumerate(keys)
+        )
+
+
+def _save_disk_cache() -> None:
+    """Atomically write the in-memory cache to disk (best effort).
+
+    The matrix is replaced before its sidecar.  If the sidecar write fails
+    (crash, full disk), the old sidecar's digest no longer matches the new
+    matrix and ``_load_disk_cache`` rejects the pair, even when the row count
+    is unchanged.
+    """
+    if not _CONTENT_EMB_CACHE:
+        return
+    keys = list(_CONTENT_EMB_CACHE)
+    matrix = np.vstack([_CONTENT_EMB_CACHE[key] for key in keys]).astype(
+        np.float32, copy=False
+    )
+    meta = {
+        "format": _CACHE_FORMAT,
+        "model": _model_id(),
+        "digest": _matrix_digest(matrix),
+        "keys": keys,
+    }
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        tmp = _CACHE_PATH.with_suffix(suffix)
+        with tmp.open("wb") as fh:
+            np.save(fh, matrix)
+        os.replace(tmp, _CACHE_PATH)
+        tmp = _CACHE_META_PATH.with_suffix(suffix)
+        tmp.write_bytes(orjson.dumps(meta))
+        os.replace(tmp, _CACHE_META_PATH)
+    except OSError as exc:
+        logger.warning("Could not persist embedding cache (%s).", exc)
+
+
+# ---------------------------------------------------------------------------
+# User-embedding LRU cache (re-submitted profiles skip the model entirely)
+# ---------------------------------------------------------------------------
+_USER_EMB_CACHE_SIZE = 1024
+_USER_EMB_CACHE: OrderedDict[str, NDArray[np.float32]] = OrderedDict()
+
+
+def _cached_user_embedding(text: str) -> NDArray[np.float32] | None:
+    """Return the cached ``(1, dim)`` embedding for *text*, if any."""
+    emb = _USER_EMB_CACHE.get(text)
+    if emb is not None:
+        _USER_EMB_CACHE.move_to_end(text)
+    return emb
+
+
+def _cache_user_embedding(text: str, emb: NDArray[np.float32]) -> None:
+    """Store a read-only copy of *emb*, evicting the least recently used."""
+    emb = emb.copy()
+    emb.setflags(write=False)
+    _USER_EMB_CACHE[text] = emb
+    if len(_USER_EMB_CACHE) > _USER_EMB_CACHE_SIZE:
+        _USER_EMB_CACHE.popitem(last=False)
+
+
+# ---------------------------------------------------------------------------
+# Retrieval helpers
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class QuantizedEmbeddings:
+    """Symmetric int8 embedding matrix with one FP32 scale per row."""
+
+    values: NDArray[np.int8]
+    scales: NDArray[np.float32]
+
+
+def quantize_embeddings(embs: NDArray[np.float32]) -> QuantizedEmbeddings:
+    """Quantise each row of *embs* to int8 using its max-abs value."""
+    scales = (np.abs(embs).max(axis=1) / 127).astype(np.float32)
+    scales[scales == 0] = 1.0
+    values = np.round(embs / scales[:, None]).astype(np.int8)
+    return QuantizedEmbeddings(values=values, scales=scales)
+
+
+def _similarities(
+    query: NDArray[np.float32],
+    content_embs: NDArray[np.float32] | QuantizedEmbeddings,
+) -> NDArray[np.float32]:
+    """Cosine similarity of unit vector *query* ``(dim,)`` against each row.
+
+    Content rows are unit vectors, so the NumPy path is one GEMV
+    (``content_embs @ query``).  SimSIMD's cosine kernel is used instead
+    when the package is installed; for int8 content the query is quantised
+    too and scored with SimSIMD's int8 kernel (cosine ignores the per-row
+    scales, so no dequantisation is needed).
+    """
+    if isinstance(content_embs, QuantizedEmbeddings):
+        if simsimd is not None:
+            q_query = quantize_embeddings(query[None, :]).values
+            dists = simsimd.cdist(q_query, content_embs.values, metric="cosine")
+            return 1.0 - np.asarray(dists)[0]
+        return (content_embs.values @ query) * content_embs.scales
+    if simsimd is not None:
+        matrix = np.ascontiguousarray(content_embs, dtype=np.float32)
+        dists = simsimd.cdist(query[None, :], matrix, metric="cosine")
+        return 1.0 - np.asarray(dists)[0]
+    return content_embs @ query
+
+
+_item_ids_cache: tuple[list[ContentItem] | None, NDArray[np.int64]] = (
+    None,
+    np.empty(0, dtype=np.int64),
+)
+
+
+def _item_ids(items: list[ContentItem]) -> NDArray[np.int64]:
+    """Return the ids of *items* as an array (memoised for the last list)."""
+    global _item_ids_cache  # noqa: PLW0603
+    cached_items, ids = _item_ids_cache
+    if cached_items is not items or len(ids) != len(items):
+        ids = np.fromiter((i.id for i in items), dtype=np.int64, count=len(items))
+        _item_ids_cache = (items, ids)
+    return ids
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
+def warmup(items: list[ContentItem]) -> None:
+    """Load the embedding model and cache embeddings for *items*."""
+    if EMBEDDING_PROVIDER != "api":
+        _get_local_model()
+    get_content_embeddings(items)
+
+
 def get_content_embeddings(items: list[ContentItem]) -> NDArray[np.float32]:
-    """Embed all content items -> ``(N, dim)``."""
-    return _embed_texts([_content_text(item) for item in items])
+    """Embed all content items -> ``(N, dim)``.
+
+    Only items missing from the cache are sent to the model (split across
+    a thread pool when there are many); the rest are served from memory
+    (or the on-disk cache).  After a miss the cache is pruned to *items*,
+    so edited or removed items do not accumulate in memory or on disk.
+    """
+    _load_disk_cache()
+    texts = _content_texts(items)
+    keys = [_cache_key(item, text) for item, text in zip(items, texts)]
+
+    misses = [
+        (key, text) for key, text in zip(keys, texts)
+        if key not in _CONTENT_EMB_CACHE
+    ]
+    if misses:
+        vecs = _embed_texts_parallel([text for _, text in misses])
+        for (key, _), vec in zip(misses, vecs):
+            _CONTENT_EMB_CACHE[key] = vec
+        # Forget items / texts that left the catalogue before persisting
+        live = set(keys)
+        for stale in [key for key in _CONTENT_EMB_CACHE if key not in live]:
+            del _CONTENT_EMB_CACHE[stale]
+        _save_disk_cache()
+
+    return np.vstack([_CONTENT_EMB_CACHE[key] for key in keys])
 
 
 def get_user_embedding(profile: UserProfile) -> NDArray[np.float32]:
-    """Embed a user profile -> ``(1, dim)``."""
-    return _embed_texts([_user_text(profile)])
+    """Embed a user profile -> ``(1, dim)`` (LRU-cached by profile text)."""
+    text = _user_text(profile)
+    emb = _cached_user_embedding(text)
+    if emb is None:
+        emb = _embed_texts([text])
+        _cache_user_embedding(text, emb)
+    return emb
+
+
+async def embed_texts_async(texts: list[str]) -> NDArray[np.float32]:
+    """Embed *texts* without blocking the event loop -> ``(N, dim)``.
+
+    API requests go through the micro-batcher; the local model runs in a
+    worker thread.
+    """
+    if EMBEDDING_PROVIDER == "api":
+        return await _get_batcher().embed(texts)
+    return await asyncio.to_thread(_embed_locally, texts)
+
+
+async def get_user_embedding_async(profile: UserProfile) -> NDArray[np.float32]:
+    """Embed a user profile without blocking the event loop -> ``(1, dim)``."""
+    text = _user_text(profile)
+    emb = _cached_user_embedding(text)
+    if emb is None:
+        emb = await embed_texts_async([text])
+        _cache_user_embedding(text, emb)
+    return emb
 
 
 def retrieve_top_k(
     user_emb: NDArray[np.float32],
-    content_embs: NDArray[np.float32],
+    content_embs: NDArray[np.float32] | QuantizedEmbeddings,
     items: list[ContentItem],
     k: int = 5,
-    exclude_ids: list[int] | None = None,
+    exclude_ids: Collection[int] | None = None,
 ) -> list[ContentItem]:
-    """Return the *k* most similar items, excluding already-viewed IDs."""
-    excluded = set(exclude_ids or [])
-    similarities = cosine_similarity(user_emb, content_embs)[0]
-
-    scored = [
-        (idx, score)
-        for idx, score in enumerate(similarities)
-        if items[idx].id not in excluded
-    ]
-    scored.sort(key=lambda pair: pair[1], reverse=True)
+    """Return the *k* most similar items, excluding already-viewed IDs.
+
+    *content_embs* must hold unit vectors (as cached by the recommender);
+    *user_emb* is normalised here, so cosine similarity is a single
+    matrix-vector product.  Excluded items are masked to ``-inf`` with one
+    ``np.isin`` over the memoised id array (pass a set to dedupe the ids)
+    and the top *k* are picked with a partial sort.
+    """
+    query = _normalise_rows(np.array(user_emb, dtype=np.float32).reshape(1, -1))
+    scores = _similarities(query[0], content_embs)
+    if exclude_ids:
+        excluded = np.fromiter(exclude_ids, dtype=np.int64, count=len(exclude_ids))
+        scores[np.isin(_item_ids(items), excluded)] = -np.inf
 
-    return [items[idx] for idx, _ in scored[:k]]
+    k = min(k, len(scores))
+    if k <= 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return [items[i] for i in top if scores[i] != -np.inf]
@@ -7,22 +7,34 @@ is configured (or when the LLM call fails).
 
 Swap the model by changing ``LLM_MODEL`` in ``.env``.
 
+The chat-completion call goes through a shared ``httpx.AsyncClient`` so
+connections (and TLS sessions) are reused across requests.
+
 Public API
 ----------
 rerank(profile, candidates) -> RerankResult
+    Coroutine; await it from an event loop.
+aclose()
+    Close the shared HTTP client (call on application shutdown).
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
 from dataclasses import dataclass, field
 
-import requests as http_requests
+import httpx
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+from pydantic import TypeAdapter
 
 from app.config import LLM_API_KEY, LLM_BASE_URL, LLM_MODEL
-from app.schemas import ContentItem, LearningStyle, Recommendation, UserProfile
+from app.data import get_all_content, get_content_version
+from app.schemas import CONTENT_FORMATS, ContentItem, Recommendation, UserProfile
 
 logger = logging.getLogger(__name__)
 
@@ -47,13 +59,27 @@ Return ONLY a JSON array with exactly 3 objects, each having:
 No text outside the JSON array.\
 """
 
+# Candidate fields sent to the LLM (serialised compactly to save tokens)
+_PROMPT_FIELDS = {
+    "id",
+    "title",
+    "description",
+    "difficulty",
+    "duration_minutes",
+    "tags",
+    "format",
+}
+
+# Markdown code fences the model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r"```(?:json)?\s*")
+
 # ---------------------------------------------------------------------------
 # Style -> preferred formats mapping
 # ---------------------------------------------------------------------------
 _STYLE_FORMAT_MAP: dict[str, set[str]] = {
-    LearningStyle.VISUAL: {"video"},
-    LearningStyle.READING: {"slides", "lecture"},
-    LearningStyle.HANDS_ON: {"video", "lecture"},
+    "visual": {"video"},
+    "reading": {"slides", "lecture"},
+    "hands-on": {"video", "lecture"},
 }
 
 _DIFFICULTY_ORDER: dict[str, int] = {
@@ -62,11 +88,19 @@ _DIFFICULTY_ORDER: dict[str, int] = {
     "Advanced": 2,
 }
 
+_FORMAT_INDEX: dict[str, int] = {fmt: i for i, fmt in enumerate(CONTENT_FORMATS)}
+
+# Validates a whole list of recommendations in one pydantic-core call
+_REC_LIST_ADAPTER = TypeAdapter(list[Recommendation])
+
+# Dumps every prompt candidate to compact JSON in one pydantic-core call
+_CANDIDATES_ADAPTER = TypeAdapter(list[ContentItem])
+
 
 # ---------------------------------------------------------------------------
 # Result container
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class RerankResult:
     """Outcome of the re-ranking step."""
 
@@ -75,6 +109,43 @@ class RerankResult:
     method: str = "llm"
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the pooled client bound to the running event loop.
+
+    Async clients cannot be shared across event loops, so the client is
+    recreated on loop change; the stale one is closed on its own loop when
+    that loop is still running.  Callers that use a throwaway loop per call
+    (``asyncio.run``) should ``await aclose()`` before it ends.
+    """
+    global _client, _client_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        if _client is not None and _client_loop.is_running():
+            asyncio.run_coroutine_threadsafe(_client.aclose(), _client_loop)
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client, _client_loop  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+    _client = _client_loop = None
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -83,9 +154,9 @@ def _build_user_prompt(
     candidates: list[ContentItem],
 ) -> str:
     """Assemble the user-turn content for the chat-completion request."""
-    items_json = json.dumps(
-        [item.model_dump() for item in candidates], indent=2
-    )
+    items_json = _CANDIDATES_ADAPTER.dump_json(
+        candidates, include={"__all__": _PROMPT_FIELDS}
+    ).decode()
     return (
         f"### Learner Profile\n"
         f"- Name: {profile.name}\n"
@@ -100,7 +171,7 @@ def _build_user_prompt(
     )
 
 
-def _call_llm(system: str, user: str) -> tuple[str, str | None]:
+async def _call_llm(system: str, user: str) -> tuple[str, str | None]:
     """Send a chat-completion request; return ``(text, reasoning)``."""
     headers = {
         "Authorization": f"Bearer {LLM_API_KEY}",
@@ -115,12 +186,12 @@ def _call_llm(system: str, user: str) -> tuple[str, str | None]:
         "temperature": 0.3,
         "max_tokens": 2048,
     }
-    resp = http_requests.post(
-        LLM_BASE_URL, json=payload, headers=headers, timeout=60
+    resp = await _get_client().post(
+        LLM_BASE_URL, content=orjson.dumps(payload), headers=headers
     )
     resp.raise_for_status()
 
-    message = resp.json()["choices"][0]["message"]
+    message = orjson.loads(resp.content)["choices"][0]["message"]
     content = (message.get("content") or "").strip()
     reasoning = (message.get("reasoning") or "").strip()
 
@@ -129,36 +200,31 @@ def _call_llm(system: str, user: str) -> tuple[str, str | None]:
         raise ValueError("LLM returned an empty response.")
 
     # Strip markdown code fences
-    response_text = re.sub(r"```(?:json)?\s*", "", response_text)
-    response_text = response_text.replace("```", "").strip()
+    response_text = _FENCE_RE.sub("", response_text).replace("```", "").strip()
 
     return response_text, reasoning or None
 
 
 def _extract_json_array(raw: str) -> list[dict]:
     """Find and parse the largest valid JSON array in *raw*."""
+    decoder = json.JSONDecoder()
     best: list[dict] = []
-    for i, ch in enumerate(raw):
-        if ch != "[":
+    i = raw.find("[")
+    while i >= 0:
+        try:
+            parsed, end = decoder.raw_decode(raw, i)
+        except json.JSONDecodeError:
+            i = raw.find("[", i + 1)
             continue
-        depth = 0
-        for j in range(i, len(raw)):
-            if raw[j] == "[":
-                depth += 1
-            elif raw[j] == "]":
-                depth -= 1
-            if depth == 0:
-                try:
-                    parsed = json.loads(raw[i : j + 1])
-                    if (
-                        isinstance(parsed, list)
-                        and len(parsed) > len(best)
-                        and all(isinstance(x, dict) for x in parsed)
-                    ):
-                        best = parsed
-                except (json.JSONDecodeError, ValueError):
-                    pass
-                break
+        if (
+            isinstance(parsed, list)
+            and len(parsed) > len(best)
+            and all(isinstance(x, dict) for x in parsed)
+        ):
+            best = parsed
+            i = raw.find("[", end)
+        else:
+            i = raw.find("[", i + 1)
     return best
 
 
@@ -172,89 +238,163 @@ def _parse_llm_response(
         raise ValueError("No valid JSON array found in LLM response.")
 
     cand_map = {c.id: c for c in candidates}
-    recommendations: list[Recommendation] = []
+    records: list[dict] = []
 
     for idx, item in enumerate(items[:3], start=1):
         cid = item.get("id")
         fallback = cand_map.get(cid)
-        recommendations.append(
-            Recommendation(
-                rank=idx,
-                id=cid,
-                title=item.get("title", fallback.title if fallback else ""),
-                format=item.get("format", fallback.format if fallback else ""),
-                difficulty=item.get(
+        records.append(
+            {
+                "rank": idx,
+                "id": cid,
+                "title": item.get("title", fallback.title if fallback else ""),
+                "format": item.get(
+                    "format", fallback.format if fallback else ""
+                ),
+                "difficulty": item.get(
                     "difficulty", fallback.difficulty if fallback else ""
                 ),
-                duration_minutes=item.get(
+                "duration_minutes": item.get(
                     "duration_minutes",
                     fallback.duration_minutes if fallback else 0,
                 ),
-                tags=item.get("tags", fallback.tags if fallback else []),
-                explanation=item.get(
+                "tags": item.get("tags", fallback.tags if fallback else []),
+                "explanation": item.get(
                     "explanation", "Recommended based on your profile."
                 ),
-            )
+            }
         )
-    return recommendations
+    return _REC_LIST_ADAPTER.validate_python(records)
 
 
 # ---------------------------------------------------------------------------
 # Rule-based fallback
 # ---------------------------------------------------------------------------
+@dataclass(slots=True)
+class _ContentArrays:
+    """Column-wise (struct-of-arrays) view of content items for scoring."""
+
+    items: list[ContentItem]
+    row_by_id: dict[int, int]
+    tag_vocab: dict[str, int]
+    tag_bits: NDArray[np.bool_]
+    ids: NDArray[np.int64]
+    durations: NDArray[np.int32]
+    difficulties: NDArray[np.int8]
+    formats: NDArray[np.int8]
+
+
+def _build_content_arrays(items: list[ContentItem]) -> _ContentArrays:
+    """Lay *items* out as parallel NumPy arrays."""
+    tag_vocab: dict[str, int] = {}
+    for item in items:
+        for tag in item.tags:
+            tag_vocab.setdefault(tag, len(tag_vocab))
+
+    tag_bits = np.zeros((len(items), len(tag_vocab)), dtype=np.bool_)
+    for row, item in enumerate(items):
+        tag_bits[row, [tag_vocab[t] for t in item.tags]] = True
+
+    return _ContentArrays(
+        items=items,
+        row_by_id={item.id: row for row, item in enumerate(items)},
+        tag_vocab=tag_vocab,
+        tag_bits=tag_bits,
+        ids=np.array([i.id for i in items], dtype=np.int64),
+        durations=np.array([i.duration_minutes for i in items], dtype=np.int32),
+        difficulties=np.array(
+            [_DIFFICULTY_ORDER.get(i.difficulty, 1) for i in items],
+            dtype=np.int8,
+        ),
+        formats=np.array([_FORMAT_INDEX[i.format] for i in items], dtype=np.int8),
+    )
+
+
+_catalogue_arrays: tuple[int, _ContentArrays] | None = None
+
+
+def _get_catalogue_arrays() -> _ContentArrays:
+    """Return the catalogue arrays, rebuilding them when the content changes."""
+    global _catalogue_arrays  # noqa: PLW0603
+    version = get_content_version()
+    if _catalogue_arrays is None or _catalogue_arrays[0] != version:
+        _catalogue_arrays = (version, _build_content_arrays(get_all_content()))
+    return _catalogue_arrays[1]
+
+
+_RULE_REASONING = (
+    "Rule-based scoring: tag overlap + format match + difficulty proximity."
+)
+
+
 def _rule_based_rerank(
     profile: UserProfile,
     candidates: list[ContentItem],
 ) -> RerankResult:
-    """Score candidates heuristically when the LLM is unavailable."""
-    user_tags = set(profile.interest_tags)
-    preferred_formats = _STYLE_FORMAT_MAP.get(profile.learning_style, set())
-    pref_diff = _DIFFICULTY_ORDER.get(profile.preferred_difficulty, 1)
+    """Score candidates heuristically when the LLM is unavailable.
 
-    scored: list[tuple[float, ContentItem]] = []
-    for item in candidates:
-        if item.id in profile.viewed_content_ids:
-            continue
-        if item.duration_minutes > profile.time_per_day:
-            continue
+    Over-budget and already-viewed items are masked out first (returning
+    early when none remain); the survivors are scored at once over the
+    precomputed catalogue arrays: tag overlap + format match - difficulty
+    distance.
+    """
+    arrays = _get_catalogue_arrays()
+    rows = [arrays.row_by_id.get(c.id) for c in candidates]
+    if None in rows or any(
+        arrays.items[r] is not c for r, c in zip(rows, candidates)
+    ):
+        arrays = _build_content_arrays(candidates)
+        rows = list(range(len(candidates)))
+    rows = np.asarray(rows, dtype=np.intp)
+
+    alive = (arrays.durations[rows] <= profile.time_per_day) & ~np.isin(
+        arrays.ids[rows], profile.viewed_content_ids
+    )
+    if not alive.any():
+        return RerankResult(reasoning_raw=_RULE_REASONING, method="rule-based")
+    keep = alive.nonzero()[0]
+    rows = rows[keep]
 
-        tag_overlap = len(user_tags & set(item.tags)) / max(len(user_tags), 1)
-        format_bonus = 0.2 if item.format in preferred_formats else 0.0
-        diff_penalty = (
-            abs(_DIFFICULTY_ORDER.get(item.difficulty, 1) - pref_diff) * 0.15
-        )
+    user_tags = set(profile.interest_tags)
+    user_bits = np.zeros(len(arrays.tag_vocab), dtype=np.float64)
+    user_bits[[arrays.tag_vocab[t] for t in user_tags if t in arrays.tag_vocab]] = 1
+    preferred_formats = [
+        _FORMAT_INDEX[f]
+        for f in _STYLE_FORMAT_MAP.get(profile.learning_style, set())
+    ]
+    pref_diff = _DIFFICULTY_ORDER.get(profile.preferred_difficulty, 1)
 
-        scored.append((tag_overlap + format_bonus - diff_penalty, item))
-
-    scored.sort(key=lambda pair: pair[0], reverse=True)
-
-    recommendations: list[Recommendation] = []
-    for rank, (score, item) in enumerate(scored[:3], start=1):
-        common = set(item.tags) & user_tags
-        recommendations.append(
-            Recommendation(
-                rank=rank,
-                id=item.id,
-                title=item.title,
-                format=item.format,
-                difficulty=item.difficulty,
-                duration_minutes=item.duration_minutes,
-                tags=item.tags,
-                explanation=(
-                    f"Matched on tags ({', '.join(common)}), "
-                    f"format fits your {profile.learning_style} style, "
-                    f"and difficulty is {item.difficulty}."
-                ),
-                match_score=round(score, 3),
-            )
-        )
+    tag_overlap = (arrays.tag_bits[rows] @ user_bits) / max(len(user_tags), 1)
+    format_bonus = np.isin(arrays.formats[rows], preferred_formats) * 0.2
+    diff_penalty = np.abs(arrays.difficulties[rows] - pref_diff) * 0.15
+    scores = tag_overlap + format_bonus - diff_penalty
+
+    top = np.argsort(-scores, kind="stable")[:3]
+    scored = [(float(scores[i]), candidates[keep[i]]) for i in top]
+
+    records = [
+        {
+            "rank": rank,
+            "id": item.id,
+            "title": item.title,
+            "format": item.format,
+            "difficulty": item.difficulty,
+            "duration_minutes": item.duration_minutes,
+            "tags": item.tags,
+            "explanation": (
+                f"Matched on tags ({', '.join(set(item.tags) & user_tags)}), "
+                f"format fits your {profile.learning_style} style, "
+                f"and difficulty is {item.difficulty}."
+            ),
+            "match_score": round(score, 3),
+        }
+        for rank, (score, item) in enumerate(scored, start=1)
+    ]
+    recommendations = _REC_LIST_ADAPTER.validate_python(records)
 
     return RerankResult(
         recommendations=recommendations,
-        reasoning_raw=(
-            "Rule-based scoring: tag overlap + format match "
-            "+ difficulty proximity."
-        ),
+        reasoning_raw=_RULE_REASONING,
         method="rule-based",
     )
 
@@ -262,7 +402,7 @@ def _rule_based_rerank(
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
-def rerank(
+async def rerank(
     profile: UserProfile,
     candidates: list[ContentItem],
 ) -> RerankResult:
@@ -277,7 +417,9 @@ def rerank(
 
     try:
         user_prompt = _build_user_prompt(profile, candidates)
-        response_text, reasoning_raw = _call_llm(_SYSTEM_PROMPT, user_prompt)
+        response_text, reasoning_raw = await _call_llm(
+            _SYSTEM_PROMPT, user_prompt
+        )
         recs = _parse_llm_response(response_text, candidates)
         return RerankResult(
             recommendations=recs,
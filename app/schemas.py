@@ -6,12 +6,10 @@ recommendation pipeline, and the frontend.
 
 Classes
 -------
-Difficulty
-    Enum of content difficulty tiers.
-LearningStyle
-    Enum of supported learner styles.
-ContentFormat
-    Enum of content delivery formats.
+Difficulty, LearningStyle, ContentFormat, PipelineStatus
+    ``Literal`` string types for the constrained fields; the matching
+    ``DIFFICULTIES`` / ``LEARNING_STYLES`` / ``CONTENT_FORMATS`` /
+    ``PIPELINE_STATUSES`` tuples list their values in order.
 ContentItem
     A single educational resource.
 UserProfile
@@ -26,53 +24,38 @@ RecommendationResponse
 
 from __future__ import annotations
 
-from enum import Enum
-from typing import Optional
+from typing import Literal, Optional, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ---------------------------------------------------------------------------
-# Enums
+# Literal value types (plain strings; validation is a set-membership check)
 # ---------------------------------------------------------------------------
-class Difficulty(str, Enum):
-    """Content difficulty tier."""
+Difficulty = Literal["Beginner", "Intermediate", "Advanced"]
+LearningStyle = Literal["visual", "reading", "hands-on"]
+ContentFormat = Literal["video", "slides", "lecture"]
+PipelineStatus = Literal["done", "skipped", "error"]
 
-    BEGINNER = "Beginner"
-    INTERMEDIATE = "Intermediate"
-    ADVANCED = "Advanced"
-
-
-class LearningStyle(str, Enum):
-    """Learner's preferred modality."""
-
-    VISUAL = "visual"
-    READING = "reading"
-    HANDS_ON = "hands-on"
-
-
-class ContentFormat(str, Enum):
-    """Delivery format of a content item."""
-
-    VIDEO = "video"
-    SLIDES = "slides"
-    LECTURE = "lecture"
-
-
-class PipelineStatus(str, Enum):
-    """Outcome of a pipeline step."""
-
-    DONE = "done"
-    SKIPPED = "skipped"
-    ERROR = "error"
+# Allowed values in canonical order, for iteration and UI option lists
+DIFFICULTIES: tuple[Difficulty, ...] = get_args(Difficulty)
+LEARNING_STYLES: tuple[LearningStyle, ...] = get_args(LearningStyle)
+CONTENT_FORMATS: tuple[ContentFormat, ...] = get_args(ContentFormat)
+PIPELINE_STATUSES: tuple[PipelineStatus, ...] = get_args(PipelineStatus)
 
 
 # ---------------------------------------------------------------------------
 # Domain models
 # ---------------------------------------------------------------------------
+# Immutable value objects: built once, never mutated, unknown keys dropped
+_VALUE_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
+
 class ContentItem(BaseModel):
     """A single educational content item."""
 
+    model_config = _VALUE_CONFIG
+
     id: int
     title: str
     description: str
@@ -98,6 +81,8 @@ class UserProfile(BaseModel):
 class Recommendation(BaseModel):
     """A single recommendation returned to the user."""
 
+    model_config = _VALUE_CONFIG
+
     rank: int = Field(..., ge=1)
     id: int
     title: str
@@ -117,6 +102,8 @@ class Recommendation(BaseModel):
 class PipelineStep(BaseModel):
     """One step in the recommendation pipeline log."""
 
+    model_config = _VALUE_CONFIG
+
     step: str
     status: PipelineStatus
     detail: str
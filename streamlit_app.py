@@ -18,14 +18,25 @@ Run
 
 from __future__ import annotations
 
+import asyncio
 import html as html_mod
+import logging
+import string
+import threading
 import time
 
 import streamlit as st
 
-from app.data import get_all_content
-from app.recommender import get_recommendations
-from app.schemas import UserProfile
+from app.data import get_all_content_dicts
+from app.recommender import get_recommendations, warmup
+from app.schemas import (
+    DIFFICULTIES,
+    LEARNING_STYLES,
+    RecommendationResponse,
+    UserProfile,
+)
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Page config
@@ -37,6 +48,42 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# ---------------------------------------------------------------------------
+# One-time warm-up (model load + catalogue embeddings, once per process)
+# ---------------------------------------------------------------------------
+@st.cache_resource(show_spinner="Loading the recommendation model\u2026")
+def _warmup() -> bool:
+    """Load the model and embed the catalogue before the first request.
+
+    A failure is logged and the first run embeds lazily, so the page still
+    renders and the pipeline error surfaces as a toast.
+    """
+    try:
+        warmup()
+    except Exception as exc:
+        logger.warning("Warm-up failed; embedding lazily instead (%s).", exc)
+        return False
+    return True
+
+
+_warmup()
+
+
+@st.cache_resource
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return one long-lived event loop per process for the pipeline.
+
+    The pooled async HTTP clients are bound to the loop they were created
+    on; running every rerun on this loop (instead of a fresh
+    ``asyncio.run``) lets them, and their open connections, be reused.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(
+        target=loop.run_forever, name="pipeline-loop", daemon=True
+    ).start()
+    return loop
+
+
 # ---------------------------------------------------------------------------
 # Session-state defaults
 # ---------------------------------------------------------------------------
@@ -65,6 +112,10 @@ DIFF_COLORS: dict[str, str] = {
 }
 
 
+# Bound once: dumps a response without re-resolving the model serializer
+_dump_response = RecommendationResponse.__pydantic_serializer__.to_python
+
+
 def _safe(text: str) -> str:
     """HTML-escape user/LLM text to prevent rendering artefacts."""
     return html_mod.escape(str(text))
@@ -163,6 +214,8 @@ section[data-testid="stSidebar"] .stTextArea label {
     border-color: rgba(102,126,234,0.3);
 }
 .g-card:hover::before { opacity:1; }
+.card-row { display:flex; gap:1rem; align-items:stretch; }
+.card-row > .g-card { flex:1 1 0; min-width:0; }
 
 .g-card .rank {
     display:inline-flex; align-items:center; justify-content:center;
@@ -407,9 +460,9 @@ with st.sidebar:
     )
     learning_style = st.selectbox(
         "\U0001f4d0 Learning style",
-        ["visual", "reading", "hands-on"],
+        LEARNING_STYLES,
         index=(
-            ["visual", "reading", "hands-on"].index(preset["learning_style"])
+            LEARNING_STYLES.index(preset["learning_style"])
             if preset
             else 0
         ),
@@ -417,9 +470,9 @@ with st.sidebar:
     )
     difficulty = st.selectbox(
         "\U0001f4ca Preferred difficulty",
-        ["Beginner", "Intermediate", "Advanced"],
+        DIFFICULTIES,
         index=(
-            ["Beginner", "Intermediate", "Advanced"].index(
+            DIFFICULTIES.index(
                 preset["preferred_difficulty"],
             )
             if preset
@@ -470,14 +523,37 @@ should_run = manual_btn or auto_triggered
 # ---------------------------------------------------------------------------
 # Card renderer
 # ---------------------------------------------------------------------------
+_CARD_TEMPLATE = string.Template(
+    '<div class="g-card">'
+    '  <div style="display:flex;align-items:center">'
+    '    <span class="rank">$rank</span>'
+    '    <span class="rank-label">RANK #$rank</span>'
+    "  </div>"
+    '  <div class="card-title">$title</div>'
+    "  <div>$pills</div>"
+    '  <div style="margin-top:6px">$tags</div>'
+    '  <div class="why-box"><b>\U0001f4a1 Why this?</b><br/>$explanation</div>'
+    "</div>"
+)
+
+
 def _render_card(rec: dict, *, show_score: bool = False) -> str:
     """Build a single recommendation card as safe HTML."""
+    fmt, difficulty, title, explanation = map(
+        _safe,
+        (
+            rec.get("format", ""),
+            rec.get("difficulty", ""),
+            rec.get("title", ""),
+            rec.get("explanation", ""),
+        ),
+    )
     fmt_icon = FORMAT_ICONS.get(rec.get("format", ""), "\U0001f4c4")
     diff_icon = DIFF_COLORS.get(rec.get("difficulty", ""), "\u26aa")
 
     pills = (
-        f'<span class="pill">{fmt_icon} {_safe(rec.get("format", ""))}</span>'
-        f'<span class="pill">{diff_icon} {_safe(rec.get("difficulty", ""))}</span>'
+        f'<span class="pill">{fmt_icon} {fmt}</span>'
+        f'<span class="pill">{diff_icon} {difficulty}</span>'
         f'<span class="pill">\u23f1 {rec.get("duration_minutes", 0)} min</span>'
     )
     if show_score and rec.get("match_score") is not None:
@@ -487,19 +563,34 @@ def _render_card(rec: dict, *, show_score: bool = False) -> str:
     tags_html = "".join(
         f'<span class="tag">{_safe(t)}</span>' for t in rec.get("tags", [])
     )
-    explanation = _safe(rec.get("explanation", ""))
 
+    return _CARD_TEMPLATE.substitute(
+        rank=rec.get("rank", 0),
+        title=title,
+        pills=pills,
+        tags=tags_html,
+        explanation=explanation,
+    )
+
+
+def _render_item(item: dict) -> str:
+    """Build a single content-browser entry as safe HTML."""
+    fmt_icon = FORMAT_ICONS.get(item.get("format", ""), "\U0001f4c4")
+    diff_icon = DIFF_COLORS.get(item.get("difficulty", ""), "\u26aa")
+    tags_html = "".join(
+        f'<span class="tag">{_safe(t)}</span>' for t in item.get("tags", [])
+    )
     return (
-        '<div class="g-card">'
-        '  <div style="display:flex;align-items:center">'
-        f'    <span class="rank">{rec.get("rank", 0)}</span>'
-        f'    <span class="rank-label">RANK #{rec.get("rank", 0)}</span>'
-        "  </div>"
-        f'  <div class="card-title">{_safe(rec.get("title", ""))}</div>'
-        f"  <div>{pills}</div>"
-        f'  <div style="margin-top:6px">{tags_html}</div>'
-        f'  <div class="why-box"><b>\U0001f4a1 Why this?</b><br/>{explanation}</div>'
-        "</div>"
+        f'<div class="c-item">'
+        f'<h4>{item["id"]}. {_safe(item["title"])}</h4>'
+        f'<div style="margin-bottom:5px">'
+        f'<span class="pill">{fmt_icon} {_safe(item["format"])}</span>'
+        f'<span class="pill">{diff_icon} {_safe(item["difficulty"])}</span>'
+        f'<span class="pill">\u23f1 {item["duration_minutes"]} min</span>'
+        f"</div>"
+        f'<p>{_safe(item["description"])}</p>'
+        f'<div style="margin-top:5px">{tags_html}</div>'
+        f"</div>"
     )
 
 
@@ -527,25 +618,33 @@ if should_run:
 
     # ── Toast progress ────────────────────────────────────────────────
     toast_box = st.empty()
-    toasts: list[str] = []
+    toast_html = ""
+    # Cosmetic pauses between toasts; off unless a demo session opts in
+    demo_pacing = st.session_state.get("demo_pacing", False)
 
     def _toast(icon: str, msg: str, cls: str = "info") -> None:
-        ts = time.strftime("%H:%M:%S")
-        toasts.append(
+        global toast_html  # noqa: PLW0603
+        lt = time.localtime()
+        ts = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        # Append to the HTML so far rather than re-joining every toast
+        toast_html += (
             f'<div class="toast {cls}">'
             f'<span class="ti">{icon}</span><span>{msg}</span>'
-            f'<span class="tt">{ts}</span></div>',
+            f'<span class="tt">{ts}</span></div>'
         )
-        toast_box.markdown("".join(toasts), unsafe_allow_html=True)
+        toast_box.markdown(toast_html, unsafe_allow_html=True)
 
     _toast("\U0001f50d", "Analysing your profile\u2026")
-    time.sleep(0.3)
+    if demo_pacing:
+        time.sleep(0.3)
 
     try:
         _toast("\U0001f916", "Finding the best content for you\u2026")
         profile = UserProfile(**payload)
-        result = get_recommendations(profile)
-        data = result.model_dump()
+        result = asyncio.run_coroutine_threadsafe(
+            get_recommendations(profile), _event_loop()
+        ).result()
+        data = _dump_response(result, exclude_none=True)
         st.session_state.api_result = data
     except Exception as exc:
         _toast("\u274c", f"Error: {_safe(str(exc))}", "err")
@@ -562,7 +661,8 @@ if should_run:
     for step in data.get("pipeline_log", []):
         label = _FRIENDLY_NAMES.get(step["step"], step["step"])
         _toast("\u2705", label, "ok")
-        time.sleep(0.15)
+        if demo_pacing:
+            time.sleep(0.15)
 
     recs = data.get("recommendations", [])
     _toast(
@@ -570,44 +670,23 @@ if should_run:
         f"Found <b>{len(recs)} personalised recommendations</b> for you!",
         "ok",
     )
-    time.sleep(0.3)
+    if demo_pacing:
+        time.sleep(0.3)
 
     # ── Recommendation cards ──────────────────────────────────────────
     st.markdown("---")
 
     if recs:
-        cols = st.columns(len(recs))
-        for col, rec in zip(cols, recs):
-            with col:
-                st.markdown(
-                    _render_card(rec, show_score=False),
-                    unsafe_allow_html=True,
-                )
+        cards = "".join(_render_card(rec, show_score=False) for rec in recs)
+        st.markdown(f'<div class="card-row">{cards}</div>', unsafe_allow_html=True)
 
     # ── Content browser ───────────────────────────────────────────────
     st.markdown("---")
     with st.expander("\U0001f4da Browse all available content", expanded=True):
         try:
-            items = [item.model_dump() for item in get_all_content()]
-            for item in items:
-                fmt_icon = FORMAT_ICONS.get(item.get("format", ""), "\U0001f4c4")
-                diff_icon = DIFF_COLORS.get(item.get("difficulty", ""), "\u26aa")
-                tags_html = "".join(
-                    f'<span class="tag">{_safe(t)}</span>'
-                    for t in item.get("tags", [])
-                )
-                st.markdown(
-                    f'<div class="c-item">'
-                    f'<h4>{item["id"]}. {_safe(item["title"])}</h4>'
-                    f'<div style="margin-bottom:5px">'
-                    f'<span class="pill">{fmt_icon} {_safe(item["format"])}</span>'
-                    f'<span class="pill">{diff_icon} {_safe(item["difficulty"])}</span>'
-                    f'<span class="pill">\u23f1 {item["duration_minutes"]} min</span>'
-                    f"</div>"
-                    f'<p>{_safe(item["description"])}</p>'
-                    f'<div style="margin-top:5px">{tags_html}</div>'
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
+            st.markdown(
+                "".join(_render_item(item) for item in get_all_content_dicts()),
+                unsafe_allow_html=True,
+            )
         except Exception:
             st.caption("Start the FastAPI server to browse content.")
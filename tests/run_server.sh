@@ -0,0 +1,27 @@
+#!/usr/bin/env sh
+# Launch the API with the throughput-oriented uvicorn settings that
+# tests/test_api.py is meant to measure: one worker per core, uvloop +
+# httptools, and no access log or proxy-header handling on the hot path.
+#
+# Usage:  tests/run_server.sh            (WORKERS / PORT env vars override)
+#         AI_EDU_SOCK=/tmp/ai_edu.sock tests/run_server.sh   (Unix socket)
+set -eu
+
+WORKERS="${WORKERS:-$(nproc 2>/dev/null || echo 1)}"
+PORT="${PORT:-8000}"
+# Lets each worker size its ONNX thread pool to its share of the cores
+export WEB_CONCURRENCY="$WORKERS"
+
+if [ -n "${AI_EDU_SOCK:-}" ]; then
+    set -- --uds "$AI_EDU_SOCK"
+else
+    set -- --host 0.0.0.0 --port "$PORT"
+fi
+
+exec uvicorn api.main:app \
+    "$@" \
+    --workers "$WORKERS" \
+    --loop uvloop \
+    --http httptools \
+    --no-access-log \
+    --no-proxy-headers
@@ -1,20 +1,54 @@
 """
 Integration test for the ``/recommend`` endpoint.
 
+A small benchmark: after ``WARMUP`` requests (so pooled connections are
+hot) it sends ``N`` timed requests (env var, default 50) in rounds of
+*CONCURRENCY* over a shared async client and writes one JSON line with
+the p50/p90/p99 latencies to stdout.  Progress, status codes and a sample
+response go to stderr, so stdout stays machine-readable.
+
+``--cache`` instead sends a single request and prints its response,
+reusing a successful one (cached on disk for an hour, keyed by the
+payload) on reruns without contacting the server.  It is opt-in and never
+used by the timed loop, so the default run always exercises the server.
+
 Usage
 -----
-1. Start the server:  ``uvicorn api.main:app --port 8000``
-2. Run this script:   ``python -m tests.test_api``
+1. Start the server:  ``tests/run_server.sh``, i.e.
+   ``uvicorn api.main:app --host 0.0.0.0 --port 8000 --workers $(nproc)
+   --loop uvloop --http httptools --no-access-log --no-proxy-headers``
+   (production alternative: ``gunicorn -k uvicorn.workers.UvicornWorker
+   -w $((2 * $(nproc) + 1)) api.main:app``)
+2. Run this script:   ``python -m tests.test_api [CONCURRENCY] [--cache]``
+
+Set ``AI_EDU_ENDPOINT`` to target another URL.  For local runs, set
+``AI_EDU_SOCK=/tmp/ai_edu.sock`` for both the launcher (which then starts
+uvicorn with ``--uds``) and this script to skip the TCP stack entirely.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import os
+import shelve
+import socket
+import statistics
 import sys
+import time
+from pathlib import Path
+from typing import TextIO
 
-import requests
+import httpx
+import orjson
 
-ENDPOINT = "http://localhost:8000/recommend"
+ENDPOINT = os.environ.get("AI_EDU_ENDPOINT", "http://localhost:8000/recommend")
+# Unix-domain socket to connect through instead of TCP (host in ENDPOINT
+# is then only used for the Host header)
+SOCK = os.environ.get("AI_EDU_SOCK") or None
+CONCURRENCY = 1  # default; overridden by the first CLI argument
+WARMUP = 3
+N = max(2, int(os.getenv("N", "50")))  # quantiles need two samples
 
 PAYLOAD = {
     "user_id": "u1",
@@ -27,19 +61,184 @@ PAYLOAD = {
     "interest_tags": ["ml", "deployment", "kubernetes"],
 }
 
+# Encoded once (orjson emits bytes directly) rather than on every call
+BODY = orjson.dumps(PAYLOAD)
+# gzip comes from the API; br is only advertised when httpx can decode it
+try:
+    import brotli  # noqa: F401
 
-def main() -> None:
-    """Fire a single recommendation request and print the response."""
-    print(f"POST {ENDPOINT}")
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        _ACCEPT_ENCODING = "br, gzip"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip"
+
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+}
+# Built once and re-sent as is: no per-call URL parsing or header merging
+REQUEST = httpx.Request("POST", ENDPOINT, content=BODY, headers=HEADERS)
+
+# Small request/response RPCs: disable Nagle (and delayed ACKs on Linux)
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_QUICKACK"):
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
+# Response cache (stdlib shelve; entries are ``(stored_at, body)``)
+CACHE_PATH = Path("~/.cache/ai_edu_recs/responses").expanduser()
+CACHE_TTL = 3600.0
+CACHE_KEY = hashlib.blake2b(
+    ENDPOINT.encode() + orjson.dumps(PAYLOAD, option=orjson.OPT_SORT_KEYS),
+    digest_size=16,
+).hexdigest()
+
+
+def _cache_get(key: str) -> bytes | None:
+    """Return the cached response body for *key* if still fresh."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with shelve.open(str(CACHE_PATH)) as cache:
+        entry = cache.get(key)
+    if entry is None or time.time() - entry[0] > CACHE_TTL:
+        return None
+    return entry[1]
+
+
+def _cache_set(key: str, body: bytes) -> None:
+    """Store a response body for *key*."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with shelve.open(str(CACHE_PATH)) as cache:
+        cache[key] = (time.time(), body)
+
+
+def _print_body(body: bytes, stream: TextIO = sys.stdout) -> None:
+    """Pretty-print a JSON response body straight to *stream*."""
+    stream.flush()
+    stream.buffer.write(
+        orjson.dumps(orjson.loads(body), option=orjson.OPT_INDENT_2)
+    )
+    stream.buffer.write(b"\n")
+
+
+async def _one(client: httpx.AsyncClient) -> tuple[int, bytes, int]:
+    """POST the payload once and return ``(status, raw body, elapsed_ns)``.
+
+    The body is streamed in 64 KiB chunks as it arrives rather than
+    buffered by the response object and copied out again.
+    """
+    t0 = time.perf_counter_ns()
+    resp = await client.send(REQUEST, stream=True)
     try:
-        resp = requests.post(ENDPOINT, json=PAYLOAD, timeout=120)
-    except requests.ConnectionError:
-        print("ERROR: Could not connect. Is the server running?")
-        sys.exit(1)
+        chunks = [chunk async for chunk in resp.aiter_bytes(65536)]
+    finally:
+        await resp.aclose()
+    return resp.status_code, b"".join(chunks), time.perf_counter_ns() - t0
+
+
+def _report(latencies_ns: list[int], errors: int, concurrency: int) -> None:
+    """Emit one machine-readable JSON line of latency percentiles (ms).
+
+    *latencies_ns* holds successful (200) responses only; failures are
+    counted in *errors* so fast error pages cannot flatter the percentiles.
+    """
+    line: dict[str, object] = {
+        "endpoint": ENDPOINT,
+        "n": len(latencies_ns),
+        "errors": errors,
+        "concurrency": concurrency,
+    }
+    if len(latencies_ns) >= 2:
+        q = statistics.quantiles(latencies_ns, n=100)
+        line |= {
+            "p50_ms": round(q[49] / 1e6, 3),
+            "p90_ms": round(q[89] / 1e6, 3),
+            "p99_ms": round(q[98] / 1e6, 3),
+        }
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(line) + b"\n")
+
+
+def _client(concurrency: int) -> httpx.AsyncClient:
+    """Build the shared async client with a pool sized for *concurrency*."""
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=concurrency, max_connections=concurrency
+        ),
+        uds=SOCK,
+        socket_options=None if SOCK else SOCKET_OPTIONS,
+    )
+    return httpx.AsyncClient(
+        transport=transport, timeout=httpx.Timeout(120.0, connect=5.0)
+    )
 
-    print(f"Status: {resp.status_code}")
-    print(json.dumps(resp.json(), indent=2))
+
+async def _cached_run() -> None:
+    """Print the cached response, or fetch (and cache) a fresh one."""
+    if (cached := _cache_get(CACHE_KEY)) is not None:
+        print(f"POST {ENDPOINT} (cached)")
+        _print_body(cached)
+        return
+
+    print(f"POST {ENDPOINT}")
+    async with _client(1) as client:
+        try:
+            status, body, _ = await _one(client)
+        except httpx.ConnectError:
+            print("ERROR: Could not connect. Is the server running?")
+            sys.exit(1)
+    print(f"Status: {status}")
+    if status == 200:
+        _cache_set(CACHE_KEY, body)
+    _print_body(body)
+
+
+async def main(concurrency: int = CONCURRENCY, *, use_cache: bool = False) -> None:
+    """Benchmark the endpoint (or, with *use_cache*, fetch one response)."""
+    if use_cache:
+        await _cached_run()
+        return
+
+    print(f"POST {ENDPOINT} x{N} (concurrency {concurrency})", file=sys.stderr)
+    async with _client(concurrency) as client:
+        try:
+            for _ in range(WARMUP):
+                await _one(client)
+            results: list[tuple[int, bytes, int]] = []
+            while len(results) < N:
+                batch = min(concurrency, N - len(results))
+                results += await asyncio.gather(
+                    *(_one(client) for _ in range(batch))
+                )
+        except httpx.ConnectError:
+            print("ERROR: Could not connect. Is the server running?", file=sys.stderr)
+            sys.exit(1)
+
+    statuses = {status for status, _, _ in results}
+    print(f"Status: {', '.join(map(str, sorted(statuses)))}", file=sys.stderr)
+    ok = [elapsed for status, _, elapsed in results if status == 200]
+    _report(ok, len(results) - len(ok), concurrency)
+    _print_body(results[0][1], sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        import uvloop  # optional: lower event-loop overhead
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    asyncio.run(
+        main(
+            int(args[0]) if args else CONCURRENCY,
+            use_cache="--cache" in sys.argv,
+        )
+    )
@@ -0,0 +1,179 @@
+"""
+Deterministic regression tests for the vectorised ranking paths.
+
+Each check compares a NumPy fast path against a plain reference built from
+the same inputs (random but seeded), or checks that the per-version caches
+follow ``replace_content``; no model or server is needed.
+
+Usage:  python -m pytest -q tests/test_ranking.py
+"""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from app import recommender
+from app.data import get_all_content, get_all_content_dicts, replace_content
+from app.embeddings import quantize_embeddings, retrieve_top_k
+from app.llm_ranker import (
+    _DIFFICULTY_ORDER,
+    _STYLE_FORMAT_MAP,
+    _get_catalogue_arrays,
+    _rule_based_rerank,
+)
+from app.schemas import ContentItem, UserProfile
+
+ITEMS = get_all_content()
+TAGS = sorted({tag for item in ITEMS for tag in item.tags}) + ["unknown-tag"]
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (the original per-item loops)
+# ---------------------------------------------------------------------------
+def _reference_rerank(
+    profile: UserProfile, candidates: list[ContentItem]
+) -> list[tuple[int, float]]:
+    """Score candidates one by one, as ``_rule_based_rerank`` used to."""
+    user_tags = set(profile.interest_tags)
+    preferred_formats = _STYLE_FORMAT_MAP.get(profile.learning_style, set())
+    pref_diff = _DIFFICULTY_ORDER.get(profile.preferred_difficulty, 1)
+
+    scored: list[tuple[float, ContentItem]] = []
+    for item in candidates:
+        if item.id in profile.viewed_content_ids:
+            continue
+        if item.duration_minutes > profile.time_per_day:
+            continue
+        tag_overlap = len(user_tags & set(item.tags)) / max(len(user_tags), 1)
+        format_bonus = 0.2 if item.format in preferred_formats else 0.0
+        diff_penalty = (
+            abs(_DIFFICULTY_ORDER.get(item.difficulty, 1) - pref_diff) * 0.15
+        )
+        scored.append((tag_overlap + format_bonus - diff_penalty, item))
+
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [(item.id, round(score, 3)) for score, item in scored[:3]]
+
+
+def _reference_top_k(
+    user_emb: np.ndarray, content_embs: np.ndarray, k: int, exclude: set[int]
+) -> list[int]:
+    """Rank every item by cosine similarity with a full sort."""
+    query = user_emb / np.linalg.norm(user_emb)
+    scores = content_embs @ query
+    order = np.argsort(-scores, kind="stable")
+    return [ITEMS[i].id for i in order if ITEMS[i].id not in exclude][:k]
+
+
+def _random_profile(rng: random.Random) -> UserProfile:
+    """Draw a profile over the catalogue's tags, styles and budgets."""
+    return UserProfile(
+        user_id="test",
+        name="Test",
+        goal="Learn",
+        learning_style=rng.choice(["visual", "reading", "hands-on"]),
+        preferred_difficulty=rng.choice(["Beginner", "Intermediate", "Advanced"]),
+        time_per_day=rng.choice([10, 30, 45, 60, 90]),
+        viewed_content_ids=rng.sample([i.id for i in ITEMS], rng.randint(0, 4)),
+        interest_tags=rng.sample(TAGS, rng.randint(0, 5)),
+    )
+
+
+def _unit_rows(rng: np.random.Generator, n: int, dim: int) -> np.ndarray:
+    """Draw *n* random unit vectors."""
+    embs = rng.standard_normal((n, dim)).astype(np.float32)
+    return embs / np.linalg.norm(embs, axis=1, keepdims=True)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+def test_rule_based_rerank_matches_reference() -> None:
+    """The vectorised heuristic picks the same items and scores as the loop."""
+    rng = random.Random(0)
+    checked = 0
+    for _ in range(500):
+        profile = _random_profile(rng)
+        candidates = rng.sample(ITEMS, 5)
+        expected = _reference_rerank(profile, candidates)
+        # Recommendation.match_score only accepts [0, 1]; skip the rest
+        if any(not 0.0 <= score <= 1.0 for _, score in expected):
+            continue
+        result = _rule_based_rerank(profile, candidates)
+        got = [(r.id, r.match_score) for r in result.recommendations]
+        assert got == expected
+        checked += 1
+    assert checked > 100
+
+
+def test_retrieve_top_k_matches_full_sort() -> None:
+    """The partial sort returns the full-sort ranking, minus excluded ids."""
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        content_embs = _unit_rows(rng, len(ITEMS), 16)
+        user_emb = rng.standard_normal(16).astype(np.float32)
+        k = int(rng.integers(1, len(ITEMS) + 2))
+        exclude = {int(i) for i in rng.choice([i.id for i in ITEMS], 3)}
+        got = retrieve_top_k(user_emb, content_embs, ITEMS, k, exclude)
+        assert [item.id for item in got] == _reference_top_k(
+            user_emb, content_embs, k, exclude
+        )
+
+
+def test_quantized_embeddings_preserve_ranking() -> None:
+    """int8 content ranks well-separated items in the FP32 order."""
+    rng = np.random.default_rng(0)
+    dim = 32
+    user_emb = _unit_rows(rng, 1, dim)[0]
+    # Rows at distinct, well-spaced angles to the query
+    angles = rng.permutation(len(ITEMS)) * 0.15
+    noise = _unit_rows(rng, len(ITEMS), dim)
+    noise -= (noise @ user_emb)[:, None] * user_emb
+    noise /= np.linalg.norm(noise, axis=1, keepdims=True)
+    content_embs = (
+        np.cos(angles)[:, None] * user_emb + np.sin(angles)[:, None] * noise
+    ).astype(np.float32)
+
+    expected = retrieve_top_k(user_emb, content_embs, ITEMS, k=len(ITEMS))
+    got = retrieve_top_k(
+        user_emb, quantize_embeddings(content_embs), ITEMS, k=len(ITEMS)
+    )
+    assert [item.id for item in got] == [item.id for item in expected]
+
+
+def test_replace_content_refreshes_version_keyed_caches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bumping the content version rebuilds every catalogue-derived cache."""
+
+    def fake_embeddings(items: list[ContentItem]) -> np.ndarray:
+        rng = np.random.default_rng(len(items))
+        return _unit_rows(rng, len(items), 8)
+
+    monkeypatch.setattr(recommender, "get_content_embeddings", fake_embeddings)
+    # Warm every cache on the current catalogue first
+    recommender._get_cached_content_embeddings()
+    _get_catalogue_arrays()
+    get_all_content_dicts()
+
+    new_items = [
+        item.model_copy(update={"title": f"{item.title} (v2)"})
+        for item in ITEMS[:-1]
+    ]
+    replace_content(new_items)
+    try:
+        items, embs = recommender._get_cached_content_embeddings()
+        assert [i.title for i in items] == [i.title for i in new_items]
+        assert len(embs) == len(new_items)
+
+        arrays = _get_catalogue_arrays()
+        assert [i.title for i in arrays.items] == [i.title for i in new_items]
+        assert list(arrays.ids) == [i.id for i in new_items]
+
+        dicts = get_all_content_dicts()
+        assert [d["title"] for d in dicts] == [i.title for i in new_items]
+    finally:
+        replace_content(ITEMS)